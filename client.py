@@ -1,16 +1,17 @@
 from abc import ABC, abstractmethod
 import asyncio
-import copy
+from collections import deque
 from dataclasses import dataclass
-import itertools
+import functools
 from typing import Literal, Optional
-from pygame import Rect, Vector2
+from pygame import Vector2
 import pygame
 from draw import (
     Drawable,
     GameOverDrawable,
     LaserDrawable,
     MoveIndicatorDrawable,
+    PieceBatchDrawable,
     PieceDrawable,
     RenderState,
     TurnIndicatorDrawable,
@@ -19,10 +20,12 @@ from logic import (
     Allegiance,
     BoardState,
     Move,
+    MoveDir,
     MoveKind,
     Piece,
     PieceKind,
-    add_dir,
+    Position,
+    clone_board_state,
     fire_laser,
     move_options,
     opponent,
@@ -31,9 +34,10 @@ from logic import (
 )
 from picking import Picker
 from protocol import ClientInterface, ServerInterface
+from timing import FrameClock
 
 
-@dataclass
+@dataclass(slots=True)
 class InitInfo:
     player_allegiance: Allegiance
     opponent_name: str
@@ -41,18 +45,45 @@ class InitInfo:
 
 type SoundEffect = Literal["laser_fire", "mirror_hit"]
 
+# Screen position of the center of the top-left board cell
+_BOARD_ORIGIN = Vector2(235, 45)
+
 
+# The server and presenter share an event loop, so messages are handed over directly: init info is
+# sent exactly once and stored with an event to wake the reader, and opponent moves are buffered in
+# a deque with an event to wake the reader.
 class LocalClient(ClientInterface):
-    init_info: asyncio.Queue[InitInfo] = asyncio.Queue()
-    opponent_moves: asyncio.Queue[Move] = asyncio.Queue()
+    _init_info: Optional[InitInfo]
+    _init_received: asyncio.Event
+    _opponent_moves: deque[Move]
+    _opponent_moved: asyncio.Event
+
+    def __init__(self) -> None:
+        self._init_info = None
+        self._init_received = asyncio.Event()
+        self._opponent_moves = deque()
+        self._opponent_moved = asyncio.Event()
 
     async def send_init(
         self, player_allegiance: Allegiance, opponent_name: str
     ) -> None:
-        self.init_info.put_nowait(InitInfo(player_allegiance, opponent_name))
+        self._init_info = InitInfo(player_allegiance, opponent_name)
+        self._init_received.set()
 
     async def send_opponent_move(self, move: Move) -> None:
-        self.opponent_moves.put_nowait(move)
+        self._opponent_moves.append(move)
+        self._opponent_moved.set()
+
+    async def init_info(self) -> InitInfo:
+        while self._init_info is None:
+            await self._init_received.wait()
+        return self._init_info
+
+    async def next_opponent_move(self) -> Move:
+        while not self._opponent_moves:
+            self._opponent_moved.clear()
+            await self._opponent_moved.wait()
+        return self._opponent_moves.popleft()
 
 
 @dataclass
@@ -77,96 +108,101 @@ class MyTurn(TurnPhase):
         self, presenter: GamePresenter, server: ServerInterface
     ) -> Optional[TurnPhase]:
         selected: Optional[Selected] = None
-        await presenter.render_state.put(
-            generate_render_state(self.board_state, None, self.allegiance)
-        )
+        # The board doesn't change until a move is made, so the piece drawables and turn indicator
+        # are built once and only the move indicators are recomputed on selection changes
+        base_drawables: list[Drawable] = [pieces_drawable(self.board_state)]
+        turn_indicator = TurnIndicatorDrawable(self.allegiance)
+        presenter.publish(base_drawables + [turn_indicator])
+
+        # Nothing moves until the turn ends, so each piece's move options only need computing once
+        @functools.cache
+        def options_for(index: int) -> set[MoveKind]:
+            return move_options(self.board_state[index], self.board_state)
+
+        # Pieces live on grid cells, so clicks can be resolved with a lookup instead of a scan. Only
+        # the player's own pieces are selectable, so the others are left out up front.
+        own_pieces_by_cell = {
+            p.position: i
+            for i, p in enumerate(self.board_state)
+            if p.allegiance == self.allegiance
+        }
         while True:
             click = await presenter.picker.next_click()
             if selected is not None:
                 piece = self.board_state[selected.index]
-                options = move_options(piece, self.board_state)
-                clicked_move = next(
-                    (
-                        m
-                        for m in options
-                        if move_hitbox(piece.position, m).collidepoint(click)
-                    ),
-                    None,
-                )
-                if clicked_move is not None:
+                clicked_move = move_at(piece.position, click)
+                if clicked_move is not None and clicked_move in options_for(
+                    selected.index
+                ):
+                    move = Move(piece.position, clicked_move)
                     # Snapshot state before sending -- server mutates the shared objects
-                    anim_state = copy.deepcopy(self.board_state)
-                    update_state(
-                        anim_state, Move(piece.position, clicked_move), self.allegiance
-                    )
-                    await server.send_move(Move(piece.position, clicked_move))
-                    return Animating(anim_state, self.allegiance)
-                hit_index = _hit_test_own_piece(
-                    click, self.board_state, self.allegiance
-                )
-                if hit_index is not None:
-                    selected = Selected(hit_index)
-                    await presenter.render_state.put(
-                        generate_render_state(
-                            self.board_state, selected.index, self.allegiance
-                        )
-                    )
-                    # await _push_selected_state(presenter, self.board_state, hit_index)
-                continue
+                    anim_state = clone_board_state(self.board_state)
+                    await server.send_move(move)
+                    return Animating(anim_state, move, self.allegiance)
 
-            hit_index = _hit_test_own_piece(click, self.board_state, self.allegiance)
-            if hit_index is not None:
+            # Only re-render when the click actually changes the selection
+            hit_index = own_pieces_by_cell.get(cell_at(click))
+            if hit_index is not None and selected != Selected(hit_index):
                 selected = Selected(hit_index)
-                await presenter.render_state.put(
-                    generate_render_state(self.board_state, hit_index, self.allegiance)
+                presenter.publish(
+                    base_drawables
+                    + move_indicators_for(
+                        self.board_state[hit_index], options_for(hit_index)
+                    )
+                    + [turn_indicator]
                 )
-                # await _push_selected_state(presenter, self.board_state, hit_index)
 
 
 @dataclass
 class Animating(TurnPhase):
-    board_state: BoardState
+    board_state: BoardState  # Snapshot from before the move, owned by this phase
+    move: Move
     allegiance: Allegiance  # The player who just moved
 
     async def next_phase(
         self, presenter: GamePresenter, server: ServerInterface
     ) -> Optional[TurnPhase]:
+        # Apply the move to the snapshot here rather than when the move is committed, so committing
+        # a move doesn't hold up the frame it happens on
+        update_state(self.board_state, self.move, self.allegiance)
         # Compute laser path from the post-move board state (before server removes the hit piece)
         laser_result = fire_laser(self.allegiance, self.board_state)
-        # Build the intermediate render state: the moved board (pre-removal)
-        base_drawables: list[Drawable] = [drawable_for(p) for p in self.board_state]
+
+        # The drawable accumulates segment lengths along the path once, which is all the timing
+        # below needs
+        laser_drawable = LaserDrawable([Vector2(p) for p in laser_result.path], 0.0)
+        distances = laser_drawable.distances
 
         # Calculate total path length in pixels for speed-based animation
-        pairs = list(itertools.pairwise(laser_result.path))
-        total_dist_cells = sum(a.distance_to(b) for a, b in pairs) if pairs else 0
+        total_dist_cells = distances[-1] if distances else 0
         total_dist_px = total_dist_cells * 90  # cells to pixels
         duration = total_dist_px / 720  # 720 pixels/sec
 
         # Compute progress values at each interior path point (mirror bounces).
         # Path points: [origin, bounce1, bounce2, ..., terminal]
-        # Interior points at indices 1..len-2 are mirror hits.
-        bounce_progresses: list[float] = []
-        if total_dist_cells > 0 and len(laser_result.path) > 2:
-            cumulative = 0.0
-            for a, b in pairs[:-1]:  # exclude last segment (ends at terminal)
-                cumulative += a.distance_to(b)
-                bounce_progresses.append(cumulative / total_dist_cells)
+        # Interior points at indices 1..len-2 are mirror hits, i.e. the ends of every segment but
+        # the last.
+        bounce_progresses: list[float] = (
+            [d / total_dist_cells for d in distances[:-1]]
+            if total_dist_cells > 0
+            else []
+        )
 
         # Fire laser sound at animation start
         presenter.sound_effects.put_nowait("laser_fire")
 
-        # Animate laser progress from 0 to 1
-        laser_drawable = LaserDrawable(laser_result.path, 0.0)
+        # Animate laser progress from 0 to 1. The frame is built once from the moved board
+        # (pre-removal); only `laser_drawable` changes, and it's mutated in place.
+        frame: list[Drawable] = [pieces_drawable(self.board_state)]
+        frame += [TurnIndicatorDrawable(self.allegiance), laser_drawable]
         next_bounce = 0  # index into bounce_progresses
-        last_time = pygame.time.get_ticks()
+        # Progress is measured from the start time rather than accumulated per frame, so late or
+        # dropped frames don't skew the animation
+        start_time = asyncio.get_running_loop().time()
         while laser_drawable.progress < 1.0:
-            now = pygame.time.get_ticks()
-            delta = (now - last_time) / 1000.0
-            last_time = now
+            now = await presenter.frame_clock.next_frame()
             if duration > 0:
-                laser_drawable.progress = min(
-                    laser_drawable.progress + delta / duration, 1.0
-                )
+                laser_drawable.progress = min((now - start_time) / duration, 1.0)
             else:
                 laser_drawable.progress = 1.0
 
@@ -178,11 +214,7 @@ class Animating(TurnPhase):
                 presenter.sound_effects.put_nowait("mirror_hit")
                 next_bounce += 1
 
-            await presenter.render_state.put(
-                generate_render_state(self.board_state, None, self.allegiance)
-                + [laser_drawable]
-            )
-            await asyncio.sleep(1 / 60)
+            presenter.publish(frame)
 
         await asyncio.sleep(1.0)
 
@@ -190,9 +222,9 @@ class Animating(TurnPhase):
         new_state = await server.get_state()
         game_winner = winner(new_state)
         if game_winner is not None:
-            final: list[Drawable] = [drawable_for(p) for p in new_state]
+            final: list[Drawable] = [pieces_drawable(new_state)]
             final.append(GameOverDrawable(game_winner))
-            await presenter.render_state.put(final)
+            presenter.publish(final)
             return None
         next_player = opponent(self.allegiance)
         return presenter.next_turn_phase(new_state, next_player)
@@ -208,19 +240,21 @@ class WaitRemoteTurn(TurnPhase):
     ) -> Optional[TurnPhase]:
         # The local player's client receives the opponent's move
         local_allegiance = opponent(self.allegiance)
-        move = await presenter.clients[local_allegiance].opponent_moves.get()
-        # Apply the move to a local copy for animation (server already mutated the real state)
-        anim_state = copy.deepcopy(self.board_state)
-        update_state(anim_state, move, self.allegiance)
-        return Animating(anim_state, self.allegiance)
+        move = await presenter.clients[local_allegiance].next_opponent_move()
+        # Animate from a local copy (server already mutated the real state)
+        anim_state = clone_board_state(self.board_state)
+        return Animating(anim_state, move, self.allegiance)
 
 
 class GamePresenter:
     local_players: set[Allegiance]
     clients: dict[Allegiance, LocalClient]
-    picker: Picker = Picker()
-    render_state: asyncio.Queue[RenderState] = asyncio.Queue()
-    sound_effects: asyncio.Queue[SoundEffect] = asyncio.Queue()
+    picker: Picker
+    # The latest render state. Publishing overwrites rather than queues, so bursts of updates
+    # coalesce into a single render.
+    render_state: RenderState
+    sound_effects: asyncio.Queue[SoundEffect]
+    frame_clock: FrameClock
 
     def __init__(
         self,
@@ -230,6 +264,10 @@ class GamePresenter:
     ) -> None:
         self.local_players = local_players
         self.clients = {"red": red, "blue": blue}
+        self.picker = Picker()
+        self.render_state = []
+        self.sound_effects = asyncio.Queue()
+        self.frame_clock = FrameClock()
 
     async def start(self, server: ServerInterface) -> None:
         state = await server.get_state()
@@ -239,8 +277,8 @@ class GamePresenter:
         # which is which -- we should get two clients from the orchestrator and assign them based on
         # the init messages. For now, this works because the orchestrator passes us clients in the
         # same order it gives them to the server, but it's brittle.
-        _red_init = await self.clients["red"].init_info.get()
-        _blue_init = await self.clients["blue"].init_info.get()
+        _red_init = await self.clients["red"].init_info()
+        _blue_init = await self.clients["blue"].init_info()
 
         phase: Optional[TurnPhase] = self.next_turn_phase(state, "red")
         while phase is not None:
@@ -252,63 +290,69 @@ class GamePresenter:
         else:
             return WaitRemoteTurn(state, allegiance)
 
-    def on_event(self, event: pygame.event.Event) -> None:
-        self.picker.on_event(event)
-
-
-def move_hitbox(piece_pos: Vector2, move: MoveKind) -> Rect:
-    cell = piece_pos * 90 + Vector2(190, 0)
-    match move:
-        case "cw":
-            return Rect(cell + Vector2(45, 0), (45, 90))
-        case "ccw":
-            return Rect(cell, (45, 90))
-        case dir:
-            return Rect(add_dir(piece_pos, dir) * 90 + Vector2(190, 0), (90, 90))
-
-
-# Check if the click hits a piece, discarding pieces that don't belong to the player. Returns the
-# index of the hit piece, or None if no piece was hit.
-def _hit_test_own_piece(
-    click: Vector2, board_state: BoardState, allegiance: Allegiance
-) -> Optional[int]:
-    return next(
-        (
-            index
-            for index, piece in enumerate(board_state)
-            if piece.allegiance == allegiance
-            and Rect(
-                piece.position * 90 + Vector2(235, 45) - Vector2(45, 45),
-                (90, 90),
-            ).collidepoint(click)
-        ),
-        None,
+    # Hand a new render state to the renderer. The list is drawn as-is rather than copied, so it
+    # mustn't be modified after it's published.
+    def publish(self, render_state: RenderState) -> None:
+        self.render_state = render_state
+
+    # Drain the SDL event queue in one batch, dispatching input events to the picker. Called once
+    # per frame. Returns the events the presenter doesn't handle, e.g. QUIT.
+    def pump_events(self) -> list[pygame.event.Event]:
+        events = pygame.event.get()
+        for event in events:
+            if event.type in _INPUT_EVENTS:
+                self.picker.on_event(event)
+        return [event for event in events if event.type not in _INPUT_EVENTS]
+
+
+_INPUT_EVENTS = frozenset(
+    (
+        pygame.constants.MOUSEBUTTONDOWN,
+        pygame.constants.MOUSEMOTION,
+        pygame.constants.MOUSEBUTTONUP,
     )
+)
 
 
-# Generate the render state for a board state with an optional selected piece. Handles drawing move
-# indicators, turn indicator, and game over screen.
-def generate_render_state(
-    board_state: BoardState, selected_index: Optional[int], player_turn: Allegiance
-) -> list[Drawable]:
-    pieces: list[Drawable] = [drawable_for(piece) for piece in board_state]
-    move_indicators: list[Drawable] = (
-        []
-        if selected_index is None
-        else [
-            MoveIndicatorDrawable(board_state[selected_index], move)
-            for move in move_options(board_state[selected_index], board_state)
-        ]
-    )
-    _winner = winner(board_state)
-    game_over: list[Drawable] = (
-        [GameOverDrawable(_winner)] if _winner is not None else []
-    )
+# Map a click in screen space to the (column, row) of the board cell under it.
+def cell_at(click: tuple[int, int]) -> Position:
+    return (click[0] - 190) // 90, click[1] // 90
+
+
+# Determine which move a click selects for the piece at `piece_pos`. Clicking the right or left half
+# of the piece rotates it clockwise or counterclockwise, and clicking an adjacent cell moves toward
+# it. Returns None if the click is anywhere else. Doesn't check whether the move is legal.
+def move_at(piece_pos: Position, click: tuple[int, int]) -> Optional[MoveKind]:
+    col, row = cell_at(click)
+    offset = (col - piece_pos[0], row - piece_pos[1])
+    if offset == (0, 0):
+        return "cw" if click[0] - (piece_pos[0] * 90 + 190) >= 45 else "ccw"
+    return _MOVE_DIR_BY_OFFSET.get(offset)
 
-    return pieces + move_indicators + game_over + [TurnIndicatorDrawable(player_turn)]
+
+_MOVE_DIR_BY_OFFSET: dict[tuple[int, int], MoveDir] = {
+    (0, -1): "n",
+    (1, -1): "ne",
+    (1, 0): "e",
+    (1, 1): "se",
+    (0, 1): "s",
+    (-1, 1): "sw",
+    (-1, 0): "w",
+    (-1, -1): "nw",
+}
+
+
+def move_indicators_for(
+    piece: Piece[PieceKind], options: set[MoveKind]
+) -> list[Drawable]:
+    return [MoveIndicatorDrawable(piece, move) for move in options]
 
 
 def drawable_for(piece: Piece[PieceKind]) -> PieceDrawable:
     return PieceDrawable(
-        piece.kind, piece.position * 90 + Vector2(235, 45), 0, piece.allegiance
+        piece.kind, Vector2(piece.position) * 90 + _BOARD_ORIGIN, 0, piece.allegiance
     )
+
+
+def pieces_drawable(board_state: BoardState) -> PieceBatchDrawable:
+    return PieceBatchDrawable([drawable_for(piece) for piece in board_state])
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+import bisect
+from dataclasses import dataclass, field
+import functools
 import itertools
 import math
 from logic import (
@@ -8,10 +10,12 @@ from logic import (
     MoveDir,
     MoveKind,
     OneSided,
+    OneSidedDir,
     Piece,
     PieceKind,
     RotateDir,
     TwoSided,
+    TwoSidedDir,
     Wall,
 )
 import pygame
@@ -20,6 +24,9 @@ from pygame.math import Vector2
 
 type RenderState = list[Drawable]
 
+# Screen position of the center of the top-left board cell
+_BOARD_ORIGIN = Vector2(235, 45)
+
 
 class Drawable(ABC):
     @abstractmethod
@@ -31,34 +38,53 @@ class Drawable(ABC):
 class LaserDrawable(Drawable):
     path: list[Vector2]
     progress: float
+    # Accumulated distance to the end of each segment, and the path transformed to world space.
+    # The path never changes once the laser is fired, so these are computed once rather than every
+    # frame.
+    distances: list[float] = field(init=False, repr=False)
+    _points: list[tuple[float, float]] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.distances = list(
+            itertools.accumulate(
+                a.distance_to(b) for a, b in itertools.pairwise(self.path)
+            )
+        )
+        self._points = [
+            (p.x * 90 + _BOARD_ORIGIN.x, p.y * 90 + _BOARD_ORIGIN.y) for p in self.path
+        ]
 
     def draw(self, surface: pygame.Surface) -> None:
-        # Laser is a list of points. The total length is the sum of the distances between each pair of
-        # points. We want to put together a list of segments mapped to the accumulated distance to the
-        # end of that segment.
-        pairs = list(itertools.pairwise(self.path))
-        total_dist = sum(a.distance_to(b) for a, b in pairs) * self.progress
-        distances = itertools.accumulate(
-            (pair[0].distance_to(pair[1]) for pair in pairs)
-        )
-        for (start, end), dist in zip(itertools.pairwise(self.path), distances):
-            seg_len = start.distance_to(end)
-            # If the laser hasn't reached the start of this segment, skip it.
-            if dist - seg_len >= total_dist:
-                continue
-            # If the laser hasn't reached the end of this segment, shorten it to the correct distance.
-            if dist > total_dist:
-                end = start + (end - start) * (
-                    (total_dist - (dist - seg_len)) / seg_len
-                )
-            # Transform from cell space to world space and draw the line segment.
-            pygame.draw.line(
-                surface,
-                (255, 63, 63),
-                (start.x * 90 + 235, start.y * 90 + 45),
-                (end.x * 90 + 235, end.y * 90 + 45),
-                5,
-            )
+        segments = laser_segments(self._points, self.distances, self.progress)
+        for x0, y0, x1, y1 in segments:
+            pygame.draw.line(surface, (255, 63, 63), (x0, y0), (x1, y1), 5)
+
+
+# Compute the lit segments of a laser that is `progress` of the way along the path through
+# `points`, as (x0, y0, x1, y1) tuples in the same space as `points`. `distances` is the accumulated
+# distance to the end of each segment. Works on plain floats so no intermediate vectors are
+# allocated.
+def laser_segments(
+    points: list[tuple[float, float]], distances: list[float], progress: float
+) -> list[tuple[float, float, float, float]]:
+    if not distances:
+        return []
+    total_dist = distances[-1] * progress
+    # Every segment before `active` is fully lit; `active` is the segment containing the head of the
+    # laser, which gets shortened to the correct distance. Later segments are skipped.
+    active = bisect.bisect_left(distances, total_dist)
+    segments = [
+        (*points[i], *points[i + 1]) for i in range(min(active, len(distances)))
+    ]
+    if active < len(distances):
+        seg_start = distances[active - 1] if active > 0 else 0.0
+        # If the laser hasn't reached the start of this segment, there's nothing to add.
+        if total_dist > seg_start:
+            t = (total_dist - seg_start) / (distances[active] - seg_start)
+            x0, y0 = points[active]
+            x1, y1 = points[active + 1]
+            segments.append((x0, y0, x0 + (x1 - x0) * t, y0 + (y1 - y0) * t))
+    return segments
 
 
 # TODO `Piece` is too inflexible for the renderer -- it can't represent pieces in the middle of
@@ -72,19 +98,79 @@ class PieceDrawable(Drawable):
     allegiance: str
 
     def draw(self, surface: pygame.Surface) -> None:
-        match self.piece.kind:
-            case "one-sided":
-                draw_one_sided(
-                    surface, self.piece, self.position, self.rotation, self.allegiance
-                )
-            case "two-sided":
-                draw_two_sided(
-                    surface, self.piece, self.position, self.rotation, self.allegiance
-                )
-            case "king":
-                draw_king(surface, self.piece, self.position, self.allegiance)
-            case "wall":
-                draw_wall(surface, self.piece, self.position, self.allegiance)
+        # Unrotated pieces are blitted from a prerendered sprite. Rotated ones (mid-animation) are
+        # rare enough to rasterize directly.
+        if self.rotation == 0:
+            sprite = piece_sprite(self.piece, self.allegiance)
+            surface.blit(sprite, self.position - _SPRITE_CENTER)
+        else:
+            draw_piece(
+                surface, self.piece, self.position, self.rotation, self.allegiance
+            )
+
+
+# Draws a whole board's worth of pieces, blitting every unrotated piece's sprite in a single
+# `blits` call rather than one call per piece.
+@dataclass
+class PieceBatchDrawable(Drawable):
+    pieces: list[PieceDrawable]
+
+    def draw(self, surface: pygame.Surface) -> None:
+        surface.blits(
+            [
+                (piece_sprite(p.piece, p.allegiance), p.position - _SPRITE_CENTER)
+                for p in self.pieces
+                if p.rotation == 0
+            ],
+            doreturn=False,
+        )
+        for p in self.pieces:
+            if p.rotation != 0:
+                p.draw(surface)
+
+
+def draw_piece(
+    surface: pygame.Surface,
+    piece: PieceKind,
+    position: Vector2,
+    rotation: float,
+    allegiance: str,
+) -> None:
+    match piece.kind:
+        case "one-sided":
+            draw_one_sided(surface, piece, position, rotation, allegiance)
+        case "two-sided":
+            draw_two_sided(surface, piece, position, rotation, allegiance)
+        case "king":
+            draw_king(surface, piece, position, allegiance)
+        case "wall":
+            draw_wall(surface, piece, position, allegiance)
+
+
+# A piece's appearance only depends on its kind, orientation and allegiance, so each distinct look
+# is rendered to a cell-sized sprite once and blitted from then on.
+def piece_sprite(piece: PieceKind, allegiance: str) -> pygame.Surface:
+    key = (allegiance, *_sprite_key(piece))
+    sprite = _PIECE_SPRITES.get(key)
+    if sprite is None:
+        sprite = pygame.Surface((90, 90), pygame.SRCALPHA)
+        draw_piece(sprite, piece, _SPRITE_CENTER, 0, allegiance)
+        _PIECE_SPRITES[key] = sprite
+    return sprite
+
+
+def _sprite_key(piece: PieceKind) -> tuple[str, ...]:
+    match piece.kind:
+        case "one-sided" | "two-sided":
+            return (piece.kind, piece.dir)
+        case "king":
+            return (piece.kind,)
+        case "wall":
+            return (piece.kind, "stacked" if piece.stacked else "unstacked")
+
+
+_SPRITE_CENTER = Vector2(45, 45)
+_PIECE_SPRITES: dict[tuple[str, ...], pygame.Surface] = {}
 
 
 @dataclass
@@ -93,18 +179,25 @@ class MoveIndicatorDrawable(Drawable):
     move: MoveKind
 
     def draw(self, surface: pygame.Surface) -> None:
-        color = (255, 255, 0)
-        offset = self.piece.position * 90 + Vector2(235, 45)
-        match self.move:
-            case "cw" | "ccw":
-                points = [x + offset for x in turn_arrow(self.move)]
-                pygame.draw.polygon(surface, color, points)
-            case "n" | "ne" | "e" | "se" | "s" | "sw" | "w" | "nw":
-                points = [
-                    rotated(x, move_dir_rotation(self.move)) + offset
-                    for x in move_arrow()
-                ]
-                pygame.draw.polygon(surface, color, points)
+        offset = Vector2(self.piece.position) * 90 + _BOARD_ORIGIN
+        surface.blit(arrow_sprite(self.move), offset - _ARROW_CENTER)
+
+
+# Each of the ten arrows is rasterized once onto its own sprite and blitted from then on. Move
+# arrows reach into the neighboring cell, so the sprites are larger than a cell and centered on the
+# piece.
+def arrow_sprite(move: MoveKind) -> pygame.Surface:
+    sprite = _ARROW_SPRITES.get(move)
+    if sprite is None:
+        sprite = pygame.Surface((210, 210), pygame.SRCALPHA)
+        points = [p + _ARROW_CENTER for p in _ARROWS[move]]
+        pygame.draw.polygon(sprite, (255, 255, 0), points)
+        _ARROW_SPRITES[move] = sprite
+    return sprite
+
+
+_ARROW_CENTER = Vector2(105, 105)
+_ARROW_SPRITES: dict[MoveKind, pygame.Surface] = {}
 
 
 def draw_one_sided(
@@ -115,21 +208,21 @@ def draw_one_sided(
     allegiance: str,
 ) -> None:
     color = (200, 0, 0) if allegiance == "red" else (0, 0, 200)
-    points = [Vector2(-35, -35), Vector2(-35, 35), Vector2(35, 35), Vector2(35, -35)]
-    match piece.dir:
-        case "ne":
-            indices = [0, 1, 2]
-        case "se":
-            indices = [0, 1, 3]
-        case "sw":
-            indices = [0, 2, 3]
-        case "nw":
-            indices = [1, 2, 3]
-    pygame.draw.polygon(
-        surface,
-        color,
-        [position + rotated(points[i], rotation) for i in indices],
-    )
+    points = _ONE_SIDED_POINTS[piece.dir]
+    if rotation != 0:
+        points = rotated_all(points, rotation)
+    pygame.draw.polygon(surface, color, [position + p for p in points])
+
+
+# Vertex templates for each piece orientation, relative to the center of the cell. These are
+# constant, so they're built once instead of on every draw.
+_CORNERS = [Vector2(-35, -35), Vector2(-35, 35), Vector2(35, 35), Vector2(35, -35)]
+_ONE_SIDED_POINTS: dict[OneSidedDir, list[Vector2]] = {
+    "ne": [_CORNERS[0], _CORNERS[1], _CORNERS[2]],
+    "se": [_CORNERS[0], _CORNERS[1], _CORNERS[3]],
+    "sw": [_CORNERS[0], _CORNERS[2], _CORNERS[3]],
+    "nw": [_CORNERS[1], _CORNERS[2], _CORNERS[3]],
+}
 
 
 def draw_two_sided(
@@ -140,30 +233,30 @@ def draw_two_sided(
     allegiance: str,
 ) -> None:
     color = (200, 0, 0) if allegiance == "red" else (0, 0, 200)
-    match piece.dir:
-        case "ne":
-            points = [
-                Vector2(-35, -35),
-                Vector2(-25, -35),
-                Vector2(35, 25),
-                Vector2(35, 35),
-                Vector2(25, 35),
-                Vector2(-35, -25),
-            ]
-        case "se":
-            points = [
-                Vector2(-35, 35),
-                Vector2(-25, 35),
-                Vector2(35, -25),
-                Vector2(35, -35),
-                Vector2(25, -35),
-                Vector2(-35, 25),
-            ]
-    pygame.draw.polygon(
-        surface,
-        color,
-        [position + rotated(points[i], rotation) for i in range(6)],
-    )
+    points = _TWO_SIDED_POINTS[piece.dir]
+    if rotation != 0:
+        points = rotated_all(points, rotation)
+    pygame.draw.polygon(surface, color, [position + p for p in points])
+
+
+_TWO_SIDED_POINTS: dict[TwoSidedDir, list[Vector2]] = {
+    "ne": [
+        Vector2(-35, -35),
+        Vector2(-25, -35),
+        Vector2(35, 25),
+        Vector2(35, 35),
+        Vector2(25, 35),
+        Vector2(-35, -25),
+    ],
+    "se": [
+        Vector2(-35, 35),
+        Vector2(-25, 35),
+        Vector2(35, -25),
+        Vector2(35, -35),
+        Vector2(25, -35),
+        Vector2(-35, 25),
+    ],
+}
 
 
 @dataclass
@@ -172,14 +265,10 @@ class GameOverDrawable(Drawable):
 
     def draw(self, surface: pygame.Surface) -> None:
         width = surface.get_width()
-        height = 80
-        banner = pygame.Surface((width, height), pygame.SRCALPHA)
-        banner.fill((0, 0, 0, 160))
-        y = (surface.get_height() - height) // 2
+        banner = _banner(width, 80)
+        y = (surface.get_height() - banner.get_height()) // 2
         surface.blit(banner, (0, y))
-        font = pygame.font.Font(None, 48)
-        label = f"{self.winner.capitalize()} Wins!"
-        text = font.render(label, True, (255, 255, 255))
+        text = rendered_text(f"{self.winner.capitalize()} Wins!", 48, (255, 255, 255))
         text_rect = text.get_rect(center=(width // 2, surface.get_height() // 2))
         surface.blit(text, text_rect)
 
@@ -190,10 +279,28 @@ class TurnIndicatorDrawable(Drawable):
 
     def draw(self, surface: pygame.Surface) -> None:
         color = (255, 0, 0) if self.allegiance == "red" else (0, 0, 255)
-        font = pygame.font.Font(None, 36)
         label = f"{self.allegiance.capitalize()} to move"
-        text = font.render(label, True, color)
-        surface.blit(text, (10, 10))
+        surface.blit(rendered_text(label, 36, color), (10, 10))
+
+
+# Loading a font and rasterizing text are both expensive, and there are only a handful of distinct
+# labels, so each one is rendered once and reused.
+@functools.cache
+def rendered_text(text: str, size: int, color: tuple[int, int, int]) -> pygame.Surface:
+    return _font(size).render(text, True, color)
+
+
+@functools.cache
+def _font(size: int) -> pygame.font.Font:
+    return pygame.font.Font(None, size)
+
+
+# The translucent game over banner only depends on its size, so it's built once and reused.
+@functools.cache
+def _banner(width: int, height: int) -> pygame.Surface:
+    banner = pygame.Surface((width, height), pygame.SRCALPHA)
+    banner.fill((0, 0, 0, 160))
+    return banner
 
 
 def draw_king(
@@ -228,34 +335,54 @@ def turn_arrow(dir: RotateDir) -> list[Vector2]:
         Vector2(math.cos(x / 60 * math.pi), -math.sin(x / 60 * math.pi)) * 40
         for x in range(20, -1, -1)
     ]
-    result = head + inside + outside
-    result = [rotated(x, math.pi / 6) for x in result]
+    result = rotated_all(head + inside + outside, math.pi / 6)
     if dir == "ccw":
         result = [Vector2(-p.x, p.y) for p in result]
     return result
 
 
-def rotated(x: Vector2, angle: float) -> Vector2:
-    cos = math.cos(angle)
-    sin = math.sin(angle)
-    return Vector2(x.x * cos - x.y * sin, x.x * sin + x.y * cos)
-
-
-def move_dir_rotation(move: MoveDir) -> float:
-    match move:
-        case "e":
-            return 0
-        case "se":
-            return math.pi / 4
-        case "s":
-            return math.pi / 2
-        case "sw":
-            return 3 * math.pi / 4
-        case "w":
-            return math.pi
-        case "nw":
-            return -3 * math.pi / 4
-        case "n":
-            return -math.pi / 2
-        case "ne":
-            return -math.pi / 4
+# Rotate a list of points by the same angle, only evaluating the trig functions once.
+def rotated_all(points: list[Vector2], angle: float) -> list[Vector2]:
+    cos, sin = _cos_sin(angle)
+    return [Vector2(p.x * cos - p.y * sin, p.x * sin + p.y * cos) for p in points]
+
+
+# Quarter turns are common (half the move directions are axis-aligned) and have exact sines and
+# cosines, so they skip the trig functions and the rounding noise that comes with them.
+def _cos_sin(angle: float) -> tuple[float, float]:
+    exact = _QUARTER_TURNS.get(angle)
+    if exact is not None:
+        return exact
+    return (math.cos(angle), math.sin(angle))
+
+
+_QUARTER_TURNS: dict[float, tuple[float, float]] = {
+    0: (1.0, 0.0),
+    math.pi / 2: (0.0, 1.0),
+    math.pi: (-1.0, 0.0),
+    -math.pi: (-1.0, 0.0),
+    -math.pi / 2: (0.0, -1.0),
+}
+
+
+_MOVE_DIR_ROTATIONS: dict[MoveDir, float] = {
+    "e": 0,
+    "se": math.pi / 4,
+    "s": math.pi / 2,
+    "sw": 3 * math.pi / 4,
+    "w": math.pi,
+    "nw": -3 * math.pi / 4,
+    "n": -math.pi / 2,
+    "ne": -math.pi / 4,
+}
+
+
+# The move and turn arrows don't depend on anything but the move, so build them once up front.
+_ARROWS: dict[MoveKind, list[Vector2]] = {
+    "cw": turn_arrow("cw"),
+    "ccw": turn_arrow("ccw"),
+    **{
+        dir: rotated_all(move_arrow(), rotation)
+        for dir, rotation in _MOVE_DIR_ROTATIONS.items()
+    },
+}
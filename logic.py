@@ -1,19 +1,25 @@
 import json
 from dataclasses import dataclass
-from pygame.math import Vector2
-from typing import Literal, Optional, TypeGuard
+from typing import Literal, Optional
 
 
 type PieceKind = OneSided | TwoSided | King | Wall
 
 type Allegiance = Literal["red", "blue"]
 
+# A (column, row) board cell. Plain integer tuples hash and compare cheaply, so they double as
+# dictionary keys; they're only converted to vectors when drawing.
+type Position = tuple[int, int]
+
 
 def opponent(allegiance: Allegiance) -> Allegiance:
-    return "red" if allegiance == "blue" else "blue"
+    return _OPPONENTS[allegiance]
+
+
+_OPPONENTS: dict[Allegiance, Allegiance] = {"red": "blue", "blue": "red"}
 
 
-@dataclass
+@dataclass(slots=True)
 class OneSided:
     kind: Literal["one-sided"]
     dir: OneSidedDir
@@ -23,20 +29,11 @@ class OneSided:
         self.dir = dir
 
     def reflect(self, direction: LaserDir) -> LaserDir | Optional[PieceKind]:
-        match (self.dir, direction):
-            case ("ne", "w") | ("nw", "e"):
-                return "n"
-            case ("ne", "s") | ("se", "n"):
-                return "e"
-            case ("se", "w") | ("sw", "e"):
-                return "s"
-            case ("sw", "n") | ("nw", "s"):
-                return "w"
-            case _:
-                return None
-
-
-@dataclass
+        # Hitting the back of the mirror destroys the piece, so there's no replacement
+        return _ONE_SIDED_REFLECTIONS.get((self.dir, direction))
+
+
+@dataclass(slots=True)
 class TwoSided:
     kind: Literal["two-sided"]
     dir: TwoSidedDir
@@ -46,18 +43,29 @@ class TwoSided:
         self.dir = dir
 
     def reflect(self, direction: LaserDir) -> LaserDir | Optional[PieceKind]:
-        match direction:
-            case "n":
-                return "w" if self.dir == "ne" else "e"
-            case "e":
-                return "s" if self.dir == "ne" else "n"
-            case "s":
-                return "e" if self.dir == "ne" else "w"
-            case "w":
-                return "n" if self.dir == "ne" else "s"
-
-
-@dataclass
+        return _TWO_SIDED_REFLECTIONS[self.dir][direction]
+
+
+# Outgoing laser direction for each (mirror orientation, incoming direction) pair. One-sided mirrors
+# only reflect off their mirrored face; anything not listed hits the back of the piece.
+_ONE_SIDED_REFLECTIONS: dict[tuple[OneSidedDir, LaserDir], LaserDir] = {
+    ("ne", "w"): "n",
+    ("nw", "e"): "n",
+    ("ne", "s"): "e",
+    ("se", "n"): "e",
+    ("se", "w"): "s",
+    ("sw", "e"): "s",
+    ("sw", "n"): "w",
+    ("nw", "s"): "w",
+}
+
+_TWO_SIDED_REFLECTIONS: dict[TwoSidedDir, dict[LaserDir, LaserDir]] = {
+    "ne": {"n": "w", "e": "s", "s": "e", "w": "n"},
+    "se": {"n": "e", "e": "n", "s": "w", "w": "s"},
+}
+
+
+@dataclass(slots=True)
 class King:
     kind: Literal["king"]
 
@@ -68,6 +76,7 @@ class King:
         return None
 
 
+@dataclass(slots=True)
 class Wall:
     kind: Literal["wall"]
     stacked: bool
@@ -80,14 +89,14 @@ class Wall:
         return Wall(stacked=False) if self.stacked else None
 
 
-@dataclass
+@dataclass(slots=True)
 class Piece[T: PieceKind]:
-    position: Vector2
+    position: Position
     allegiance: Allegiance
     kind: T
 
 
-x = Piece(Vector2(0, 0), "red", Wall())
+x = Piece((0, 0), "red", Wall())
 
 
 type BoardState = list[Piece[PieceKind]]
@@ -98,13 +107,13 @@ type MoveDir = Literal["n", "ne", "e", "se", "s", "sw", "w", "nw"]
 type RotateDir = Literal["cw", "ccw"]
 
 
-@dataclass
+@dataclass(slots=True)
 class Move:
-    piece: Vector2
+    piece: Position
     kind: MoveKind
 
 
-@dataclass
+@dataclass(slots=True)
 class LaserHit:
     index: int
     replacement: Optional[PieceKind]
@@ -115,86 +124,71 @@ type OneSidedDir = Literal["ne", "se", "sw", "nw"]
 type TwoSidedDir = Literal["ne", "se"]
 
 
-@dataclass
+@dataclass(slots=True)
 class LaserResult:
-    path: list[Vector2]
+    path: list[Position]
     hit: Optional[LaserHit]
 
 
-@dataclass
+@dataclass(slots=True)
 class Laser:
-    position: Vector2
+    position: Position
     direction: LaserDir
 
     @staticmethod
     def start(player: Allegiance) -> Laser:
         match player:
             case "red":
-                return Laser(Vector2(0, -1), "s")
+                return Laser((0, -1), "s")
             case "blue":
-                return Laser(Vector2(9, 8), "n")
+                return Laser((9, 8), "n")
 
+    # Trace the laser across the board, bouncing off mirrors, until it leaves the board or hits a
+    # piece that absorbs it. Records the start, every bounce and the end point in the path.
     def bounce(self, state: BoardState) -> LaserResult:
-        path: list[Vector2] = [Vector2(self.position)]
-
-        def trace() -> Optional[LaserHit]:
-            hit_index = self.cast(state)
-            # cast mutates self.position to the hit piece's position (or off-board)
-            path.append(Vector2(self.position))
+        path: list[Position] = [self.position]
+        # Index the board once so each cell the laser crosses is a single lookup
+        occupied = cell_index(state)
+        x, y = self.position
+        direction = self.direction
+        while True:
+            dx, dy = _LASER_STEPS[direction]
+            x += dx
+            y += dy
+            if not (0 <= x < 10 and 0 <= y < 8):
+                path.append((x, y))
+                return LaserResult(path, None)
+            hit_index = occupied.get((x, y))
             if hit_index is None:
-                return None
-            match state[hit_index].kind.reflect(self.direction):
+                continue
+            path.append((x, y))
+            match state[hit_index].kind.reflect(direction):
                 case "n" | "e" | "s" | "w" as new_dir:
-                    self.direction = new_dir
-                    return trace()
+                    direction = new_dir
                 case new_piece:
-                    return LaserHit(hit_index, new_piece)
-
-        hit = trace()
-        return LaserResult(path, hit)
-
-    # Raycast a laser in a straight line until it hits a wall (return None) or a piece (return
-    # its index).
-    def cast(self, state: BoardState) -> Optional[int]:
-        next_seg = self.advance()
-        if next_seg is None:
-            return None
-        hit_index = next(
-            (i for i, piece in enumerate(state) if piece.position == next_seg.position),
-            None,
-        )
-        if hit_index is not None:
-            return hit_index
-        return next_seg.cast(state)
-
-    # Advance the laser one cell in its current direction. Returns the new laser state, or None if
-    # it goes off the board.
-    def advance(self) -> Optional[Laser]:
-        match self.direction:
-            case "n":
-                self.position += Vector2(0, -1)
-            case "e":
-                self.position += Vector2(1, 0)
-            case "s":
-                self.position += Vector2(0, 1)
-            case "w":
-                self.position += Vector2(-1, 0)
-        return (
-            self if (0 <= self.position.x < 10 and 0 <= self.position.y < 8) else None
-        )
-
-
-def is_king_piece(piece: Piece[PieceKind]) -> TypeGuard[Piece[King]]:
-    return piece.kind.kind == "king"
+                    return LaserResult(path, LaserHit(hit_index, new_piece))
+
+
+# Integer cell offset for each laser direction. Stepping integer coordinates avoids allocating a new
+# vector for every cell the laser crosses.
+_LASER_STEPS: dict[LaserDir, tuple[int, int]] = {
+    "n": (0, -1),
+    "e": (1, 0),
+    "s": (0, 1),
+    "w": (-1, 0),
+}
 
 
 # Returns the allegiance of the winner, or None if there is no winner yet. This doubles as the "game
 # over" check.
 def winner(state: BoardState) -> Optional[Allegiance]:
-    kings: list[Piece[King]] = [piece for piece in state if is_king_piece(piece)]
-    if len(kings) < 2:
-        return kings[0].allegiance
-    return None
+    survivor: Optional[Piece[PieceKind]] = None
+    for piece in state:
+        if piece.kind.kind == "king":
+            if survivor is not None:
+                return None  # Both kings are still standing
+            survivor = piece
+    return survivor.allegiance if survivor is not None else None
 
 
 # Validate and apply a move to a board state. Returns the new board state if the move is valid, or
@@ -210,7 +204,7 @@ def update_state(
     match move.kind:
         case "n" | "ne" | "e" | "se" | "s" | "sw" | "w" | "nw":
             target = add_dir(piece.position, move.kind)
-            if not (0 <= target.x < 10 and 0 <= target.y < 8):
+            if not (0 <= target[0] < 10 and 0 <= target[1] < 8):
                 return None  # Target position is out of bounds
             if any(piece.position == target for piece in state):
                 return None  # Target position is occupied
@@ -226,24 +220,22 @@ def update_state(
     return state
 
 
-def add_dir(position: Vector2, dir: MoveDir) -> Vector2:
-    match dir:
-        case "n":
-            return position + Vector2(0, -1)
-        case "ne":
-            return position + Vector2(1, -1)
-        case "e":
-            return position + Vector2(1, 0)
-        case "se":
-            return position + Vector2(1, 1)
-        case "s":
-            return position + Vector2(0, 1)
-        case "sw":
-            return position + Vector2(-1, 1)
-        case "w":
-            return position + Vector2(-1, 0)
-        case "nw":
-            return position + Vector2(-1, -1)
+def add_dir(position: Position, dir: MoveDir) -> Position:
+    dx, dy = _MOVE_STEPS[dir]
+    return (position[0] + dx, position[1] + dy)
+
+
+# Integer cell offset for each move direction.
+_MOVE_STEPS: dict[MoveDir, tuple[int, int]] = {
+    "n": (0, -1),
+    "ne": (1, -1),
+    "e": (1, 0),
+    "se": (1, 1),
+    "s": (0, 1),
+    "sw": (-1, 1),
+    "w": (-1, 0),
+    "nw": (-1, -1),
+}
 
 
 def fire_laser(player: Allegiance, state: BoardState) -> LaserResult:
@@ -257,34 +249,57 @@ def move_options(piece: Piece[PieceKind], state: BoardState) -> set[MoveKind]:
         case "one-sided" | "two-sided":
             options.add("cw")
             options.add("ccw")
-    # Directional movement: check all 8 adjacent cells
-    all_dirs: list[MoveDir] = ["n", "ne", "e", "se", "s", "sw", "w", "nw"]
-    for dir in all_dirs:
-        target = add_dir(piece.position, dir)
-        if not (0 <= target.x < 10 and 0 <= target.y < 8):
+    # Directional movement: check all 8 adjacent cells against an index of the occupied ones, rather
+    # than scanning the board for each
+    occupied = cell_index(state)
+    x, y = piece.position
+    for dir, (dx, dy) in _MOVE_STEPS.items():
+        target = (x + dx, y + dy)
+        if not (0 <= target[0] < 10 and 0 <= target[1] < 8):
             continue
-        if any(p.position == target for p in state):
+        if target in occupied:
             continue
         options.add(dir)
     return options
 
 
+# Map each occupied (column, row) cell to the index of the piece on it.
+def cell_index(state: BoardState) -> dict[Position, int]:
+    return {p.position: i for i, p in enumerate(state)}
+
+
 def rotate_one_sided(piece: OneSided, dir: RotateDir) -> None:
-    match piece.dir:
-        case "ne":
-            piece.dir = "se" if dir == "cw" else "nw"
-        case "se":
-            piece.dir = "sw" if dir == "cw" else "ne"
-        case "sw":
-            piece.dir = "nw" if dir == "cw" else "se"
-        case "nw":
-            piece.dir = "ne" if dir == "cw" else "sw"
+    piece.dir = _ONE_SIDED_ROTATIONS[dir][piece.dir]
+
+
+_ONE_SIDED_ROTATIONS: dict[RotateDir, dict[OneSidedDir, OneSidedDir]] = {
+    "cw": {"ne": "se", "se": "sw", "sw": "nw", "nw": "ne"},
+    "ccw": {"ne": "nw", "nw": "sw", "sw": "se", "se": "ne"},
+}
 
 
 def rotate_two_sided(piece: TwoSided) -> None:
     piece.dir = "se" if piece.dir == "ne" else "ne"
 
 
+# Copy a board state so it can be mutated independently of the original. Much cheaper than
+# `copy.deepcopy` since it knows exactly which objects need duplicating.
+def clone_board_state(state: BoardState) -> BoardState:
+    return [Piece(p.position, p.allegiance, clone_kind(p.kind)) for p in state]
+
+
+def clone_kind(kind: PieceKind) -> PieceKind:
+    match kind.kind:
+        case "one-sided":
+            return OneSided(kind.dir)
+        case "two-sided":
+            return TwoSided(kind.dir)
+        case "king":
+            return King()
+        case "wall":
+            return Wall(kind.stacked)
+
+
 def load_board_state(path: str) -> BoardState:
     with open(path) as f:
         data = json.load(f)
@@ -302,5 +317,5 @@ def load_board_state(path: str) -> BoardState:
                 kind = Wall(p.get("stacked", True))
             case other:
                 raise ValueError(f"Unknown piece kind: {other}")
-        pieces.append(Piece(Vector2(p["x"], p["y"]), p["allegiance"], kind))
+        pieces.append(Piece((p["x"], p["y"]), p["allegiance"], kind))
     return pieces
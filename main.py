@@ -1,9 +1,9 @@
 import asyncio
 import pygame
 import sys
+from typing import Callable, Optional
 
-from client import GamePresenter, LocalClient
-from draw import Drawable
+from client import GamePresenter, LocalClient, SoundEffect
 from logic import load_board_state
 from server import LocalServer
 
@@ -15,6 +15,12 @@ def _patch_pygame_sysfont():
     import sys
     import types
 
+    # Feature-check rather than version-check, since no release carries the fix yet: if pygame's
+    # own import of the font module went through, the cycle didn't bite and there's nothing to do
+    font = sys.modules.get("pygame.font")
+    if font is not None and getattr(font, "Font", None) is not None:
+        return
+
     # Pre-load a stub for pygame.font so sysfont's top-level
     # `from pygame.font import Font` doesn't trigger the real import cycle.
     stub = types.ModuleType("pygame.font")
@@ -51,9 +57,30 @@ async def main() -> None:
     pygame.init()
     pygame.mixer.init()
     surface = pygame.display.set_mode((1280, 720))
-
-    laser_fire_sound = pygame.mixer.Sound("laserSmall_002.ogg")
-    mirror_hit_sound = pygame.mixer.Sound("impactGlass_light_001.ogg")
+    # Only mouse input and QUIT are ever handled, so keep every other event out of the queue
+    # entirely instead of fetching and discarding it each frame. The picker allows mouse motion
+    # itself while it's tracking a press.
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(
+        [
+            pygame.constants.MOUSEBUTTONDOWN,
+            pygame.constants.MOUSEBUTTONUP,
+            pygame.constants.QUIT,
+        ]
+    )
+
+    sounds: dict[SoundEffect, pygame.mixer.Sound] = {
+        "laser_fire": pygame.mixer.Sound("laserSmall_002.ogg"),
+        "mirror_hit": pygame.mixer.Sound("impactGlass_light_001.ogg"),
+    }
+
+    # The background and checkerboard never change, so draw them once and blit them every frame
+    background = pygame.Surface(surface.get_size()).convert()
+    background.fill((28, 72, 28))
+    for y in range(0, 8):
+        for x in range(0, 10):
+            color = (180, 180, 128) if (x + y) % 2 == 0 else (24, 24, 24)
+            pygame.draw.rect(background, color, (x * 90 + 190, y * 90, 90, 90))
 
     red = LocalClient()
     blue = LocalClient()
@@ -65,44 +92,43 @@ async def main() -> None:
         presenter_task = presenter.start(server)
         await asyncio.gather(server_task, presenter_task)
 
-    render_state: list[Drawable] = []
-
-    async def sync_render_state() -> None:
-        while True:
-            render_state[:] = await presenter.render_state.get()
-
     asyncio.create_task(start_game())
-    asyncio.create_task(sync_render_state())
 
     while True:
-        for event in pygame.event.get():
-            presenter.on_event(event)
+        for event in presenter.pump_events():
             if event.type == pygame.constants.QUIT:
                 pygame.quit()
                 sys.exit()
 
-        surface.fill((28, 72, 28))
+        surface.blit(background, (0, 0))
 
-        # Drain and play any queued sound effects
+        # Drain and play any queued sound effects. The same effect queued more than once in a
+        # frame would just stack on top of itself, so each one is played at most once per frame.
+        effects: set[SoundEffect] = set()
         while not presenter.sound_effects.empty():
-            effect = presenter.sound_effects.get_nowait()
-            match effect:
-                case "laser_fire":
-                    laser_fire_sound.play()
-                case "mirror_hit":
-                    mirror_hit_sound.play()
-
-        for y in range(0, 8):
-            for x in range(0, 10):
-                color = (180, 180, 128) if (x + y) % 2 == 0 else (24, 24, 24)
-                pygame.draw.rect(surface, color, (x * 90 + 190, y * 90, 90, 90))
-
-        for drawable in render_state:
+            effects.add(presenter.sound_effects.get_nowait())
+        for effect in effects:
+            sounds[effect].play()
+
+        # Published render states are never modified afterwards, so the latest one is drawn
+        # directly rather than being copied or handed over by another task
+        for drawable in presenter.render_state:
             drawable.draw(surface)
 
         pygame.display.flip()
-        await asyncio.sleep(1 / 60)  # yield to event loop
+        # Render on the same timer that drives the animations, so each frame is one scheduled
+        # wakeup shared by everything waiting on it
+        await presenter.frame_clock.next_frame()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop's libuv-based event loop cuts scheduling overhead for the frame and animation loops.
+    # It's optional (and unavailable on Windows), so fall back to the stock loop without it.
+    loop_factory: Optional[Callable[[], asyncio.AbstractEventLoop]]
+    try:
+        import uvloop  # type: ignore[import-not-found]
+
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+    asyncio.run(main(), loop_factory=loop_factory)
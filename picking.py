@@ -1,66 +1,75 @@
 import asyncio
-from typing import Literal, TypedDict
-from pygame import Vector2
+from typing import Callable, Optional
 import pygame
 
 
 class Picker:
-    _down: asyncio.Queue[Vector2] = asyncio.Queue()
-    _move: asyncio.Queue[Vector2] = asyncio.Queue()
-    _up: asyncio.Queue[Vector2] = asyncio.Queue()
-
-    async def next_click(self) -> Vector2:
-        async def next_cancel(down_at: Vector2) -> CancelClick:
-            while True:
-                if (await self._move.get() - down_at).length() > 5:
-                    return {"type": "cancel"}
-
-        async def next_up() -> FinishClick:
-            return {"type": "up", "pos": await self._up.get()}
-
-        while True:
-            while not self._down.empty():
-                self._down.get_nowait()
-
-            down_at = await self._down.get()
-
-            while not self._move.empty():
-                self._move.get_nowait()
-            cancel_task: asyncio.Task[PendingClickEvent] = asyncio.create_task(
-                next_cancel(down_at)
-            )
-
-            while not self._up.empty():
-                self._up.get_nowait()
-            up_task: asyncio.Task[PendingClickEvent] = asyncio.create_task(next_up())
-
-            done, pending = await asyncio.wait(
-                [cancel_task, up_task],
-                return_when=asyncio.FIRST_COMPLETED,
-            )
-            for task in pending:
-                task.cancel()
-            result = done.pop().result()
-            if result["type"] == "up":
-                return result["pos"]
+    # The click currently being waited on, completed directly from `on_event`.
+    _pending: Optional[asyncio.Future[tuple[int, int]]]
+    # Where the current press started, or None if there is no press or it turned into a drag.
+    _down_at: Optional[tuple[int, int]]
+
+    def __init__(self) -> None:
+        self._pending = None
+        self._down_at = None
+
+    async def next_click(self) -> tuple[int, int]:
+        self._track_press(None)
+        self._pending = asyncio.get_running_loop().create_future()
+        try:
+            return await self._pending
+        finally:
+            self._pending = None
 
     def on_event(self, event: pygame.event.Event) -> None:
-        match event.type:
-            case pygame.constants.MOUSEBUTTONDOWN if event.button == 1:
-                self._down.put_nowait(Vector2(event.pos))
-            case pygame.constants.MOUSEMOTION:
-                self._move.put_nowait(Vector2(event.pos))
-            case pygame.constants.MOUSEBUTTONUP if event.button == 1:
-                self._up.put_nowait(Vector2(event.pos))
-
-
-class FinishClick(TypedDict):
-    type: Literal["up"]
-    pos: Vector2
-
-
-class CancelClick(TypedDict):
-    type: Literal["cancel"]
-
-
-type PendingClickEvent = FinishClick | CancelClick
+        if self._pending is None or self._pending.done():
+            return
+        handler = _HANDLERS.get(event.type)
+        if handler is not None:
+            handler(self, event)
+
+    def _on_down(self, event: pygame.event.Event) -> None:
+        if event.button == 1:
+            self._track_press(event.pos)
+
+    def _on_motion(self, event: pygame.event.Event) -> None:
+        if self._down_at is not None and _dragged(self._down_at, event.pos):
+            self._track_press(None)
+
+    def _on_up(self, event: pygame.event.Event) -> None:
+        if event.button != 1:
+            return
+        # Motion isn't queued until the press has been handled, so a drag can end before any motion
+        # event arrives. Check the release position too rather than relying on `_on_motion`.
+        if (
+            self._down_at is not None
+            and self._pending is not None
+            and not _dragged(self._down_at, event.pos)
+        ):
+            self._pending.set_result(event.pos)
+        self._track_press(None)
+
+    # Motion only matters while a press might still become a click, so SDL is told to drop motion
+    # events the rest of the time rather than queueing one per mouse poll.
+    def _track_press(self, down_at: Optional[tuple[int, int]]) -> None:
+        self._down_at = down_at
+        if down_at is None:
+            pygame.event.set_blocked(pygame.constants.MOUSEMOTION)
+        else:
+            pygame.event.set_allowed(pygame.constants.MOUSEMOTION)
+
+
+# Whether the cursor has moved far enough from where it was pressed to count as a drag. Compares
+# squared distances so no vector or square root is needed per motion event.
+def _dragged(down_at: tuple[int, int], pos: tuple[int, int]) -> bool:
+    dx = pos[0] - down_at[0]
+    dy = pos[1] - down_at[1]
+    return dx * dx + dy * dy > 25
+
+
+# Dispatch on event type with a single dict lookup, since `on_event` sees every mouse motion
+_HANDLERS: dict[int, Callable[[Picker, pygame.event.Event], None]] = {
+    pygame.constants.MOUSEBUTTONDOWN: Picker._on_down,
+    pygame.constants.MOUSEMOTION: Picker._on_motion,
+    pygame.constants.MOUSEBUTTONUP: Picker._on_up,
+}
@@ -1,4 +1,5 @@
 import asyncio
+from collections import deque
 from logic import (
     Allegiance,
     BoardState,
@@ -9,13 +10,15 @@ from logic import (
     winner,
 )
 from protocol import ClientInterface, ServerInterface
-from typing import Literal, TypedDict
+from typing import Literal, Optional
 
 
 type TryMoveResult = Literal["invalid", "ok"]
 
 
 class Game:
+    __slots__ = ("state", "player_turn")
+
     state: BoardState
     player_turn: Allegiance
 
@@ -23,34 +26,45 @@ class Game:
         self.state = state
         self.player_turn = "red"
 
-    def try_move(self, move: Move) -> bool:
+    # Apply a move for the player whose turn it is. Returns whether the move was valid, and the
+    # winner if the move ended the game.
+    def try_move(self, move: Move) -> tuple[bool, Optional[Allegiance]]:
         new_state = update_state(self.state, move, self.player_turn)
         if new_state is None:
-            return False
+            return False, None
         self.state = new_state
         # Fire the laser and apply the result
         result = fire_laser(self.player_turn, self.state)
+        winner_allegiance = None
         if result.hit is not None:
             if result.hit.replacement is not None:
                 self.state[result.hit.index].kind = result.hit.replacement
             else:
-                del self.state[result.hit.index]
-        winner_allegiance = winner(self.state)
+                # The game can only end when a piece is destroyed, so the board only needs to be
+                # scanned for surviving kings then
+                destroyed = self.state.pop(result.hit.index)
+                if destroyed.kind.kind == "king":
+                    winner_allegiance = winner(self.state)
         if winner_allegiance is None:
             self.player_turn = opponent(self.player_turn)
-        return True
+        return True, winner_allegiance
 
 
 class LocalServer(ServerInterface):
     # Shared game state.
     game: Game
-    client_moves: asyncio.Queue[Move] = asyncio.Queue()
+    # Accepted moves waiting to be forwarded, each with the winner if it ended the game, and an
+    # event to wake the server loop. Normally there's at most one, but a remote client can send
+    # its next move before the loop has caught up.
+    _accepted_moves: deque[tuple[Move, Optional[Allegiance]]]
+    _move_accepted: asyncio.Event
 
     def __init__(self, state: BoardState) -> None:
         self.game = Game(state)
+        self._accepted_moves = deque()
+        self._move_accepted = asyncio.Event()
 
     async def start(self, red: ClientInterface, blue: ClientInterface) -> None:
-        clients: Clients = {"red": red, "blue": blue}
         await red.send_init(
             player_allegiance="red",
             opponent_name="TODO",
@@ -59,23 +73,24 @@ class LocalServer(ServerInterface):
             player_allegiance="blue",
             opponent_name="TODO",
         )
+        # Turns alternate starting with red, so each move is forwarded to whoever is waiting and
+        # then the two players swap roles
+        moving, waiting = red, blue
         while True:
-            move = await self.client_moves.get()
-            # `move` is from the player who just moved, but `self.game.player_turn` will already
-            # have been updated to the next player, so we can just send the latest move to the
-            # player whose turn it is now.
-            await clients[self.game.player_turn].send_opponent_move(move)
-            if winner(self.game.state) is not None:
+            while not self._accepted_moves:
+                self._move_accepted.clear()
+                await self._move_accepted.wait()
+            move, winner_allegiance = self._accepted_moves.popleft()
+            await waiting.send_opponent_move(move)
+            if winner_allegiance is not None:
                 break
+            moving, waiting = waiting, moving
 
     async def send_move(self, move: Move) -> None:
-        if self.game.try_move(move):
-            await self.client_moves.put(move)
+        ok, winner_allegiance = self.game.try_move(move)
+        if ok:
+            self._accepted_moves.append((move, winner_allegiance))
+            self._move_accepted.set()
 
     async def get_state(self) -> BoardState:
         return self.game.state
-
-
-class Clients(TypedDict):
-    red: ClientInterface
-    blue: ClientInterface
@@ -0,0 +1,52 @@
+import asyncio
+from typing import Optional
+
+
+# Wakes any number of waiters once per frame off a single recurring timer, rather than each waiter
+# scheduling its own sleep. The timer only runs while something is waiting on it, and deadlines are
+# advanced by a fixed period so frames don't drift.
+class FrameClock:
+    _period: float
+    _frame: asyncio.Event
+    _time: float
+    _deadline: float
+    _waiters: int
+    _handle: Optional[asyncio.TimerHandle]
+
+    def __init__(self, fps: float = 60) -> None:
+        self._period = 1 / fps
+        self._frame = asyncio.Event()
+        self._time = 0.0
+        self._deadline = 0.0
+        self._waiters = 0
+        self._handle = None
+
+    # Wait for the next frame tick. Returns the event loop time of the tick.
+    async def next_frame(self) -> float:
+        if self._handle is None:
+            loop = asyncio.get_running_loop()
+            self._deadline = loop.time() + self._period
+            self._handle = loop.call_at(self._deadline, self._tick)
+        # Each tick swaps in a fresh event, so waiters never have to clear it themselves
+        frame = self._frame
+        self._waiters += 1
+        try:
+            await frame.wait()
+        finally:
+            self._waiters -= 1
+        return self._time
+
+    def _tick(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._time = loop.time()
+        frame, self._frame = self._frame, asyncio.Event()
+        waiting = self._waiters > 0
+        frame.set()
+        if not waiting:
+            self._handle = None
+            return
+        self._deadline += self._period
+        if self._deadline <= self._time:
+            # Skip frames we've fallen behind on instead of firing them back to back
+            self._deadline = self._time + self._period
+        self._handle = loop.call_at(self._deadline, self._tick)